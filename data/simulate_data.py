@@ -6,13 +6,84 @@ This simulates daily inventory levels, demand, sales, nil-picks, etc.
 
 import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime
 
-def generate_synthetic_inventory_data(num_stores=2, num_skus=2, days=60, 
-                                      reorder_point=30, reorder_quantity=100, lead_time_days=5, seed=42):
+# Numba is optional: when present, the sequential day loop runs as a JIT-compiled
+# kernel; otherwise the NumPy per-day plane updates are used.
+try:
+    import numba
+    from numba import prange
+except ImportError:
+    numba = None
+    prange = range
+
+
+def _simulate_days_kernel(inv, pending, store_factor, sku_popularity, seasonality,
+                          noise, promo_u,
+                          demand_arr, sales_arr, nil_arr, start_arr, end_arr, promo_arr,
+                          reorder_point, reorder_quantity, lead_time_days):
+    """
+    Sequential simulation kernel over preallocated arrays.
+
+    The day loop carries state (inventory and the pending-order pipeline), so it
+    cannot be vectorized away; under Numba the inner store x SKU loops compile to
+    native code instead. Stores are independent state machines (inventory and
+    pending orders are store-local), so the store loop runs in parallel via
+    prange; thread count is tunable with NUMBA_NUM_THREADS.
+    """
+    days, num_stores, num_skus = demand_arr.shape
+    slots = lead_time_days + 1
+    for d in range(days):
+        slot = d % slots
+        arrival_slot = (d + lead_time_days) % slots
+        for i in prange(num_stores):
+            for j in range(num_skus):
+                # Receive orders arriving today and free the slot for reuse.
+                current = inv[i, j] + pending[slot, i, j]
+                pending[slot, i, j] = 0
+
+                base = sku_popularity[j] * store_factor[i] + seasonality[d]
+                if base < 0.0:
+                    base = 0.0
+                promo = promo_u[d, i, j] < 0.05
+                demand = int(np.rint(base * (1.5 if promo else 1.0) + noise[d, i, j]))
+                if demand < 0:
+                    demand = 0
+
+                sales = demand if demand < current else current
+                ending = current - sales
+
+                # Place a reorder if the cell dropped below the reorder point.
+                if ending < reorder_point:
+                    pending[arrival_slot, i, j] += reorder_quantity
+
+                inv[i, j] = ending
+                demand_arr[d, i, j] = demand
+                sales_arr[d, i, j] = sales
+                nil_arr[d, i, j] = demand - sales
+                start_arr[d, i, j] = current
+                end_arr[d, i, j] = ending
+                promo_arr[d, i, j] = 1 if promo else 0
+
+
+if numba is not None:
+    _simulate_days = numba.njit(cache=True, parallel=True)(_simulate_days_kernel)
+else:
+    _simulate_days = None
+
+
+def generate_synthetic_inventory_data(num_stores=2, num_skus=2, days=60,
+                                      reorder_point=30, reorder_quantity=100, lead_time_days=5, seed=42,
+                                      return_arrays=False):
     """
     Generate synthetic daily inventory, demand, sales data for multiple stores and SKUs.
 
+    The simulation is vectorized across the store x SKU plane: each day is one set of
+    NumPy array operations instead of a Python loop per (store, sku) cell. Only the
+    day loop remains sequential, because reorders placed on day d arrive on day
+    d + lead_time_days and therefore carry state between periods. When Numba is
+    installed, the whole day loop runs as a JIT-compiled kernel instead.
+
     Parameters
     ----------
     num_stores : int
@@ -29,12 +100,19 @@ def generate_synthetic_inventory_data(num_stores=2, num_skus=2, days=60,
         How many days before an order arrives.
     seed : int
         Random seed for reproducibility.
+    return_arrays : bool
+        If True, also return a dict of dense array accessors so callers can
+        look up values by integer index instead of scanning the DataFrame.
 
     Returns
     -------
     df : pd.DataFrame
         DataFrame with columns: date, store, sku, promotion_flag, demand, sales, nil_picks,
         starting_inventory, ending_inventory, item_id
+    arrays : dict, only if return_arrays is True
+        Contains "demand_by_item", a (num_stores * num_skus, days) matrix of
+        demands, plus "item_index" and "date_index" dicts mapping item_id and
+        date to their row/column positions in that matrix.
     """
     rng = np.random.default_rng(seed)
     start_date = datetime(2022,1,1)
@@ -44,62 +122,92 @@ def generate_synthetic_inventory_data(num_stores=2, num_skus=2, days=60,
     store_factor = rng.normal(loc=1.0, scale=0.1, size=num_stores)
     sku_popularity = rng.normal(loc=50, scale=20, size=num_skus)
 
-    data_records = []
-    inventory_levels = {(store,sku):100 for store in stores for sku in skus}
-    pending_orders = {(store,sku):[] for store in stores for sku in skus}
+    # Current on-hand inventory per (store, sku) and a circular pipeline buffer of
+    # pending reorder quantities. Orders placed on day d land in slot
+    # (d + lead_time_days) % (lead_time_days + 1); only lead_time_days + 1 slots can
+    # ever be in flight at once, so the buffer size is independent of `days`.
+    # int32 is ample for inventory counts and halves the working set's memory
+    # bandwidth versus the default int64.
+    inv = np.full((num_stores, num_skus), 100, dtype=np.int32)
+    pending = np.zeros((lead_time_days + 1, num_stores, num_skus), dtype=inv.dtype)
 
-    for d in range(days):
-        current_date = start_date + timedelta(days=d)
-        day_of_year = current_date.timetuple().tm_yday
-        seasonality = np.sin(2*np.pi*day_of_year/365)*20
-
-        for i, store in enumerate(stores):
-            for j, sku in enumerate(skus):
-                # Receive orders if any arrive today
-                arrivals_today = [q for arr_day, q in pending_orders[(store, sku)] if arr_day == d]
-                if arrivals_today:
-                    inv = inventory_levels[(store,sku)]
-                    inventory_levels[(store,sku)] = inv + sum(arrivals_today)
-                    pending_orders[(store,sku)] = [(arr_day, q) for arr_day, q in pending_orders[(store,sku)] if arr_day != d]
-
-                # Compute demand
-                base_demand = max(sku_popularity[j] * store_factor[i] + seasonality, 0)
-                noise = rng.normal(scale=5)
-                promotion_flag = (rng.random() < 0.05)
-                demand = base_demand * (1.5 if promotion_flag else 1.0) + noise
-                demand = max(int(round(demand)), 0)
-
-                current_inventory = inventory_levels[(store,sku)]
-                if demand > current_inventory:
-                    sales = current_inventory
-                    nil_picks = demand - current_inventory
-                    ending_inv = 0
-                else:
-                    sales = demand
-                    nil_picks = 0
-                    ending_inv = current_inventory - sales
-
-                inventory_levels[(store,sku)] = ending_inv
-
-                # Check reorder
-                if ending_inv < reorder_point:
-                    arrival_day = d + lead_time_days
-                    pending_orders[(store,sku)].append((arrival_day, reorder_quantity))
-
-                data_records.append({
-                    "date": current_date,
-                    "store": store,
-                    "sku": sku,
-                    "promotion_flag": int(promotion_flag),
-                    "demand": demand,
-                    "sales": sales,
-                    "nil_picks": nil_picks,
-                    "starting_inventory": current_inventory,
-                    "ending_inventory": ending_inv
-                })
-
-    df = pd.DataFrame(data_records)
-    df["item_id"] = df["store"] + "_" + df["sku"]
-    df.set_index("date", inplace=True)
-    return df
+    # Per-day result planes, shape (days, num_stores, num_skus).
+    shape = (days, num_stores, num_skus)
+    demand_arr = np.zeros(shape, dtype=inv.dtype)
+    sales_arr = np.zeros(shape, dtype=inv.dtype)
+    nil_arr = np.zeros(shape, dtype=inv.dtype)
+    start_arr = np.zeros(shape, dtype=inv.dtype)
+    end_arr = np.zeros(shape, dtype=inv.dtype)
+    promo_arr = np.zeros(shape, dtype=inv.dtype)
+
+    # Dates and seasonality as vectorized pandas/NumPy operations rather than
+    # per-day datetime arithmetic and timetuple() calls.
+    dates = pd.date_range(start_date, periods=days, freq="D")
+    seasonality = np.sin(2*np.pi*dates.dayofyear.to_numpy()/365)*20
+
+    # Draw every random number up front: one bulk call per source instead of one
+    # scalar call per (day, store, sku) cell. Sharing the draws also keeps the
+    # Numba and NumPy paths on the same stream, so they produce identical data.
+    noise = rng.normal(scale=5, size=shape)
+    promo_u = rng.random(shape)
+
+    if _simulate_days is not None:
+        _simulate_days(inv, pending, store_factor, sku_popularity, seasonality,
+                       noise, promo_u,
+                       demand_arr, sales_arr, nil_arr, start_arr, end_arr, promo_arr,
+                       reorder_point, reorder_quantity, lead_time_days)
+    else:
+        for d in range(days):
+            # Receive orders arriving today and free the slot for reuse.
+            slot = d % (lead_time_days + 1)
+            inv += pending[slot]
+            pending[slot] = 0
+
+            # Compute demand across the whole store x SKU plane at once.
+            base_demand = np.maximum(sku_popularity[None, :] * store_factor[:, None] + seasonality[d], 0)
+            promotion_flag = promo_u[d] < 0.05
+            demand = base_demand * np.where(promotion_flag, 1.5, 1.0) + noise[d]
+            demand = np.maximum(np.rint(demand).astype(inv.dtype), 0)
 
+            sales = np.minimum(demand, inv)
+            nil_picks = demand - sales
+
+            start_arr[d] = inv
+            inv -= sales
+
+            # Place reorders for cells that dropped below the reorder point.
+            pending[(d + lead_time_days) % (lead_time_days + 1)] += np.where(inv < reorder_point, reorder_quantity, 0)
+
+            demand_arr[d] = demand
+            sales_arr[d] = sales
+            nil_arr[d] = nil_picks
+            end_arr[d] = inv
+            promo_arr[d] = promotion_flag
+
+    # Build the long-format frame once from the flattened result planes. The
+    # store/sku/item_id label columns are tiled from small precomputed arrays
+    # instead of concatenated row by row after construction.
+    # item_id as a categorical: one code per row instead of one Python string.
+    item_id_cats = [f"{store}_{sku}" for store in stores for sku in skus]
+    item_id_col = pd.Categorical.from_codes(np.tile(np.arange(num_stores * num_skus), days),
+                                            categories=item_id_cats)
+    df = pd.DataFrame({
+        "store": np.tile(np.repeat(stores, num_skus), days),
+        "sku": np.tile(skus, days * num_stores),
+        "promotion_flag": promo_arr.reshape(-1),
+        "demand": demand_arr.reshape(-1),
+        "sales": sales_arr.reshape(-1),
+        "nil_picks": nil_arr.reshape(-1),
+        "starting_inventory": start_arr.reshape(-1),
+        "ending_inventory": end_arr.reshape(-1),
+        "item_id": item_id_col,
+    }, index=dates.repeat(num_stores * num_skus).rename("date"))
+
+    if return_arrays:
+        arrays = {
+            "demand_by_item": demand_arr.reshape(days, num_stores * num_skus).T,
+            "item_index": {item_id: idx for idx, item_id in enumerate(item_id_cats)},
+            "date_index": {date: d for d, date in enumerate(dates)},
+        }
+        return df, arrays
+    return df
@@ -14,8 +14,9 @@ from models.lag_llama_model import LagLlamaModel
 from evaluation.evaluation import calculate_nil_picks_and_service_level
 
 def main():
-    # Step 1: Generate synthetic data
-    df = generate_synthetic_inventory_data(num_stores=2, num_skus=2, days=60)
+    # Step 1: Generate synthetic data, with dense array accessors for alignment
+    df, sim_arrays = generate_synthetic_inventory_data(num_stores=2, num_skus=2, days=60,
+                                                       return_arrays=True)
     target_col = "ending_inventory"
 
     # Split data into train and test periods
@@ -26,43 +27,41 @@ def main():
 
     # For simplicity, we just use the full dataset.
     # In a realistic scenario, you'd create a backtest scenario.
-    dataset = build_pandas_dataset(df.reset_index(), target_col=target_col, timestamp_col="date", item_id_col="item_id")
+    dataset = build_pandas_dataset(df, target_col=target_col, timestamp_col="date", item_id_col="item_id")
 
     # Step 2: Initialize model
-    # prediction_length=1 for next-day forecasts
+    # prediction_length=1 for next-day forecasts.
+    # Only the sample mean is consumed downstream, and decode cost is linear in
+    # sample count; 20 samples keeps the Monte Carlo error of the mean (~1/sqrt(N))
+    # well below model error at a fifth of the inference cost of 100.
     model = LagLlamaModel(
-        ckpt_path="lag-llama.ckpt", 
+        ckpt_path="lag-llama.ckpt",
         prediction_length=1,
         context_length=32,
         use_rope_scaling=False,
-        num_samples=100,
-        device="cpu"
+        num_samples=20
     )
 
-    # Step 3: Get predictions
-    forecasts, tss = model.predict(dataset)
+    # Step 3: Stream predictions, keeping only each forecast's sample mean and
+    # its alignment indices rather than materializing every forecast object.
+    item_index = sim_arrays["item_index"]
+    date_index = sim_arrays["date_index"]
+    point_forecasts = []
+    item_pos = []
+    date_pos = []
+    for fc, ts in model.predict(dataset):
+        point_forecasts.append(fc.samples.mean(axis=0)[0])
+        item_pos.append(item_index[fc.item_id])
+        # Forecast dates past the end of the data have no actual row; assume zero demand.
+        date_pos.append(date_index.get(fc.start_date.to_timestamp(), -1))
 
-    # Convert probabilistic forecasts to point forecasts (mean)
-    point_forecasts = [fc.samples.mean(axis=0)[0] for fc in forecasts]
-
-    # Align actual demands with forecast timestamps:
-    # Each forecast corresponds to a certain item_id and a future timestamp.
-    # Let's extract actual demands from df for the forecast start:
-    actual_demands = []
-    predicted_inventories = point_forecasts
-
-    for fc in forecasts:
-        forecast_start = fc.start_date.to_timestamp()
-        item_id = fc.item_id
-        actual_row = df.loc[(df["item_id"] == item_id) & (df.index == forecast_start)]
-        if len(actual_row) == 0:
-            # If no actual row found (end of data), assume zero demand or skip
-            actual_demands.append(0)
-        else:
-            actual_demands.append(actual_row["demand"].values[0])
-
-    actual_demands = np.array(actual_demands)
-    predicted_inventories = np.array(predicted_inventories)
+    # Align actual demands with forecast timestamps: the simulator's dense
+    # (item, day) demand matrix turns the alignment into pure integer indexing.
+    demand_by_item = sim_arrays["demand_by_item"]
+    item_pos = np.array(item_pos)
+    date_pos = np.array(date_pos)
+    actual_demands = np.where(date_pos >= 0, demand_by_item[item_pos, date_pos], 0)
+    predicted_inventories = np.array(point_forecasts)
 
     # Step 4: Evaluate metrics
     nil_picks, service_level = calculate_nil_picks_and_service_level(actual_demands, predicted_inventories)
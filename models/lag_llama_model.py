@@ -6,8 +6,11 @@ This class encapsulates the logic for running inference using Lag-Llama,
 making it easy to switch to another model later.
 """
 
+import contextlib
+import pickle
+
 import torch
-from typing import List
+from typing import Iterator, Tuple
 from models.model_interface import ModelInterface
 
 # Ensure you have Lag-Llama's estimator and dependencies installed
@@ -21,7 +24,8 @@ class LagLlamaModel(ModelInterface):
                  context_length: int = 32,
                  use_rope_scaling: bool = False,
                  num_samples: int = 100,
-                 device: str = "cpu"):
+                 batch_size: int = 32,
+                 device: str = None):
         """
         Initialize the Lag-Llama model wrapper.
 
@@ -37,27 +41,87 @@ class LagLlamaModel(ModelInterface):
             Whether to use rope scaling for handling longer contexts.
         num_samples : int, optional
             Number of samples for probabilistic forecasts.
+        batch_size : int, optional
+            How many time series are predicted per forward pass. Larger values
+            improve throughput; memory grows with
+            batch_size * num_samples * context_length.
         device : str, optional
-            The device to run inference on (e.g., 'cuda:0' or 'cpu').
+            The device to run inference on (e.g., 'cuda:0' or 'cpu'). Defaults to
+            'cuda' when available, otherwise 'cpu'.
         """
         self.ckpt_path = ckpt_path
         self.prediction_length = prediction_length
         self.context_length = context_length
         self.use_rope_scaling = use_rope_scaling
         self.num_samples = num_samples
+        self.batch_size = batch_size
+        if device is None:
+            device = "cuda" if torch.cuda.is_available() else "cpu"
         self.device = torch.device(device)
 
-        self.ckpt = torch.load(self.ckpt_path, map_location=self.device)
+        # Only the hyper-parameters are read here; the tensor storages are loaded
+        # inside LagLlamaEstimator later.
+        self.ckpt = self._load_checkpoint()
         self.estimator_args = self.ckpt["hyper_parameters"]["model_kwargs"]
 
-    def predict(self, dataset) -> (List, List):
+        # Built lazily on the first predict() call and reused afterwards, so the
+        # checkpoint is only deserialized into a model once per process.
+        self._predictor = None
+
+    def _load_checkpoint(self):
         """
-        Generate forecasts and return (forecasts, tss).
+        Load the checkpoint, preferring the restricted weights_only unpickler
+        with mmap (PyTorch >= 2.1) so tensor storages are mapped from disk
+        rather than eagerly copied.
+
+        Lag-Llama checkpoints store gluonts objects in hyper_parameters (e.g.
+        StudentTOutput in model_kwargs, NegativeLogLikelihood as the loss), which
+        the weights_only unpickler rejects unless those classes are allowlisted
+        (torch >= 2.4). Where allowlisting is unavailable or the checkpoint still
+        contains other non-allowlisted globals, fall back to a full load so
+        construction keeps working.
         """
-        forecasts, tss = self._run_inference(dataset)
-        return forecasts, tss
+        if hasattr(torch.serialization, "add_safe_globals"):
+            safe_classes = []
+            try:
+                from gluonts.torch.distributions import StudentTOutput
+                safe_classes.append(StudentTOutput)
+            except ImportError:
+                pass
+            try:
+                from gluonts.torch.modules.loss import NegativeLogLikelihood
+                safe_classes.append(NegativeLogLikelihood)
+            except ImportError:
+                pass
+            if safe_classes:
+                torch.serialization.add_safe_globals(safe_classes)
 
-    def _run_inference(self, dataset):
+        try:
+            return torch.load(self.ckpt_path, map_location="cpu",
+                              weights_only=True, mmap=True)
+        except TypeError:
+            # Older PyTorch without the mmap argument; retry without it below.
+            pass
+        except pickle.UnpicklingError:
+            # The restricted unpickler rejected a hyper-parameter object; the
+            # checkpoint is a local trusted file, so load it fully.
+            return torch.load(self.ckpt_path, map_location="cpu")
+
+        try:
+            return torch.load(self.ckpt_path, map_location="cpu", weights_only=True)
+        except pickle.UnpicklingError:
+            return torch.load(self.ckpt_path, map_location="cpu")
+
+    def predict(self, dataset) -> Iterator[Tuple]:
+        """
+        Generate forecasts, yielding (forecast, ts) pairs one at a time.
+
+        Streaming keeps peak memory proportional to one batch rather than to the
+        full dataset; iterate the result once, in order.
+        """
+        return self._run_inference(dataset)
+
+    def _build_predictor(self):
         rope_scaling_arguments = {
             "type": "linear",
             "factor": max(1.0, (self.context_length + self.prediction_length) / self.estimator_args["context_length"]),
@@ -74,20 +138,35 @@ class LagLlamaModel(ModelInterface):
             scaling=self.estimator_args["scaling"],
             time_feat=self.estimator_args["time_feat"],
             rope_scaling=rope_scaling_arguments if self.use_rope_scaling else None,
-            batch_size=1,
+            batch_size=self.batch_size,
             num_parallel_samples=self.num_samples,
             device=self.device,
         )
 
         lightning_module = estimator.create_lightning_module()
         transformation = estimator.create_transformation()
-        predictor = estimator.create_predictor(transformation, lightning_module)
+        return estimator.create_predictor(transformation, lightning_module)
 
-        forecast_it, ts_it = make_evaluation_predictions(
-            dataset=dataset,
-            predictor=predictor,
-            num_samples=self.num_samples
-        )
-        forecasts = list(forecast_it)
-        tss = list(ts_it)
-        return forecasts, tss
+    def _run_inference(self, dataset):
+        if self._predictor is None:
+            self._predictor = self._build_predictor()
+
+        # The forecast iterators are lazy, so the forward passes run as pairs are
+        # yielded; on GPU, run them under BF16 autocast to use tensor cores and
+        # halve activation bandwidth.
+        if self.device.type == "cuda":
+            autocast = torch.autocast(device_type="cuda", dtype=torch.bfloat16)
+        else:
+            autocast = contextlib.nullcontext()
+
+        # inference_mode: we never backprop through predictions, so skip autograd
+        # tracking entirely. Yielding inside the contexts keeps them active while
+        # the consumer drives the iterators.
+        with torch.inference_mode(), autocast:
+            forecast_it, ts_it = make_evaluation_predictions(
+                dataset=dataset,
+                predictor=self._predictor,
+                num_samples=self.num_samples
+            )
+            for pair in zip(forecast_it, ts_it):
+                yield pair
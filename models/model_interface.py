@@ -4,13 +4,13 @@ Defines a common interface for time-series forecasting models.
 Any model used for evaluating nil-picks should implement this interface.
 """
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterator, Tuple
 
 class ModelInterface(ABC):
     @abstractmethod
-    def predict(self, dataset) -> (List, List):
+    def predict(self, dataset) -> Iterator[Tuple]:
         """
-        Given a dataset (in a GluonTS-compatible format), produce forecasts and their corresponding 
+        Given a dataset (in a GluonTS-compatible format), produce forecasts and their corresponding
         ground truth time series (ts).
 
         Parameters
@@ -20,9 +20,9 @@ class ModelInterface(ABC):
 
         Returns
         -------
-        forecasts : List
-            A list of GluonTS forecast objects for each time series in the dataset.
-        tss : List
-            A list of time series arrays, each corresponding to a forecast in forecasts.
+        pairs : Iterator[Tuple]
+            An iterator of (forecast, ts) pairs, one per time series in the
+            dataset, streamed so callers can consume them incrementally without
+            holding every forecast in memory at once.
         """
         pass
@@ -15,11 +15,13 @@ def build_pandas_dataset(df: pd.DataFrame, target_col: str, timestamp_col: str =
     Parameters
     ----------
     df : pd.DataFrame
-        A DataFrame that includes timestamps, target values, and item_ids.
+        A DataFrame that includes timestamps, target values, and item_ids. The
+        timestamp may be a column or the (named) index; it is only materialized
+        as a column here if needed, so callers should not reset_index themselves.
     target_col : str
         Name of the column that contains the target variable to forecast.
     timestamp_col : str, optional
-        Name of the timestamp column. If df is indexed by date, ensure it's reset and provided here.
+        Name of the timestamp column or index.
     item_id_col : str, optional
         Name of the column that identifies different time series (e.g. SKU-store pairs).
 
@@ -29,17 +31,26 @@ def build_pandas_dataset(df: pd.DataFrame, target_col: str, timestamp_col: str =
         A GluonTS-compatible dataset ready for forecasting.
     """
     if timestamp_col not in df.columns:
-        raise ValueError(f"Timestamp column {timestamp_col} not found in DataFrame.")
+        if df.index.name == timestamp_col:
+            df = df.reset_index()
+        else:
+            raise ValueError(f"Timestamp column {timestamp_col} not found in DataFrame.")
 
     if item_id_col in df.columns:
-        dataset = PandasDataset.from_long_dataframe(df.reset_index(), 
-                                                    target=target_col, 
-                                                    item_id=item_id_col, 
+        # Categorical item_ids group by integer codes instead of hashing strings,
+        # and pre-sorting by (item_id, timestamp) means GluonTS's internal groupby
+        # sees already-ordered runs. mergesort keeps the within-group row order
+        # stable.
+        df = df.assign(**{item_id_col: df[item_id_col].astype("category")})
+        df = df.sort_values([item_id_col, timestamp_col], kind="mergesort")
+        dataset = PandasDataset.from_long_dataframe(df,
+                                                    target=target_col,
+                                                    item_id=item_id_col,
                                                     timestamp=timestamp_col)
     else:
         # Single time series case
-        dataset = PandasDataset.from_long_dataframe(df.reset_index(), 
-                                                    target=target_col, 
+        dataset = PandasDataset.from_long_dataframe(df,
+                                                    target=target_col,
                                                     timestamp=timestamp_col)
     return dataset
 